@@ -1,51 +1,260 @@
 import random
 import math
-from collections import deque
+import functools
+import logging
+import multiprocessing
+from collections import deque, Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    from numba.extending import is_jitted
+except ImportError:
+    # Numba is optional: without it the compiled kernels below simply run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+    prange = range
+
+    def is_jitted(function):
+        return False
+
+
+# Genes are stored as fixed-width integers so that a population is a single contiguous matrix.
+# All genes lie in [0, 100], so int8 is wide enough to store them. Fitness functions must not add up genes in int8:
+# Python ones get the genes as Python integers (see Candidate.calculate_fitness), compiled ones widen their accumulator.
+GENE_DTYPE = np.int8
+
+# Shared NumPy random generator used by the vectorized operators
+rng = np.random.default_rng()
+
+logger = logging.getLogger(__name__)
+
+# Number of random values the local search loops draw per vectorized call
+RANDOM_CHUNK_SIZE = 4096
+
+
+@njit
+def _seed_kernel_random(seed):
+    # Inside compiled code np.random is Numba's own generator, which is seeded separately from NumPy's
+    np.random.seed(seed)
+
+
+def set_random_seed(seed=None):
+    """
+    Seeds every random number source used by the examples, so that runs can be reproduced.
+
+    The examples draw from Python's random module, the shared NumPy generator rng and, inside the Numba-compiled
+    search kernels, Numba's own random state. All three are seeded from the one value.
+
+    :param seed: An integer seed, or None to seed from operating system entropy.
+    """
+    random.seed(seed)
+    # Reseed rng in place, so that references to it held elsewhere see the new state too
+    rng.bit_generator.state = type(rng.bit_generator)(seed).state
+    _seed_kernel_random(int(rng.integers(2 ** 32)))
+
+
+def _float_dtype(chromosome):
+    # Dtype of offspring whose genes are no longer integers: float32 holds the small integer genes exactly and halves
+    # the memory traffic of float64, while chromosomes that are already wider floats keep their precision
+    return np.result_type(chromosome.dtype, np.float32)
+
+
+def _fitness_argument(chromosome, fitness_function):
+    # Numba-compiled fitness functions take the NumPy array. Python ones get a list of Python numbers instead: they
+    # iterate it several times faster than the array, and its sums cannot overflow like narrow NumPy integers.
+    return chromosome if is_jitted(fitness_function) else chromosome.tolist()
 
 
 class Candidate:
+    # Fixed attribute layout: no per-instance __dict__, as many short-lived candidates are created
+    __slots__ = ('chromosome', 'fitness')
+
     def __init__(self, chromosome, fitness=0.0):
         """
         Initialize a Candidate object.
 
-        :param chromosome: A list of integers representing a candidate solution.
+        :param chromosome: A NumPy array of integers representing a candidate solution.
         """
-        self.chromosome = chromosome  # List of integers representing the solution
+        self.chromosome = chromosome  # NumPy array of integers representing the solution
         self.fitness = fitness
 
     def calculate_fitness(self, fitness_function):
         """
         Calculates and updates the fitness value for this candidate.
 
-        :param fitness_function: A function that takes a chromosome and returns a fitness value.
+        :param fitness_function: A function that takes a chromosome and returns a fitness value. Python functions are
+            given the chromosome as a list, Numba-compiled ones (see sum_fitness) as the NumPy array.
         """
-        self.fitness = fitness_function(self.chromosome)
+        self.fitness = fitness_function(_fitness_argument(self.chromosome, fitness_function))
 
 
 def get_random_population(pop_size=20, gene_size=50):
-    # Generate a list of pop_size candidates
-    population = []
+    """
+    Generates a random population.
 
-    for _ in range(pop_size):
-        # Generate a chromosome with gene_size random integers between 0 and 100
-        chromosome = [random.randint(0, 100) for _ in range(gene_size)]
-        # Create a Candidate object with the random chromosome and random fitness in the range (0.0, 1.0)
-        candidate = Candidate(chromosome, random.uniform(0.0, 1.0))
-        # Add to the list of candidates
-        population.append(candidate)
+    :param pop_size: The number of candidates in the population.
+    :param gene_size: The number of genes in each chromosome.
+    :return: A tuple of the (pop_size, gene_size) chromosome matrix and the matching fitness vector.
+    """
+    # Generate every chromosome in one call: gene_size random integers between 0 and 100 per row
+    chromosomes = rng.integers(0, 101, size=(pop_size, gene_size), dtype=GENE_DTYPE)
+    # Generate a parallel vector of random fitness values in the range (0.0, 1.0)
+    fitnesses = rng.random(pop_size)
 
     # Print out each candidate's chromosome and fitness
-    for idx, candidate in enumerate(population):
-        print(f"Candidate {idx + 1}: Chromosome = {candidate.chromosome[:5]}..., Fitness = {candidate.fitness:.4f}")
+    for idx in range(pop_size):
+        print(f"Candidate {idx + 1}: Chromosome = {chromosomes[idx, :5]}..., Fitness = {fitnesses[idx]:.4f}")
+
+    return chromosomes, fitnesses
+
+
+def cached_fitness(fitness_function, cache_capacity=1024):
+    """
+    Wraps a fitness function with an LRU cache keyed on the chromosome's genes.
+
+    Caching only pays off when the fitness function is expensive compared to hashing the chromosome. The wrapper is a
+    Python function, so the local searches do not take their compiled Numba path for it, even if the wrapped fitness
+    function is compiled.
+
+    :param fitness_function: A function that takes a chromosome and returns a fitness value.
+    :param cache_capacity: The maximum number of fitness values to remember (None for unbounded).
+    :return: The wrapped fitness function; its cache_info() reports hits and misses for tuning the capacity.
+    """
+    @functools.lru_cache(maxsize=cache_capacity)
+    def lookup(genes):
+        return fitness_function(np.array(genes) if is_jitted(fitness_function) else list(genes))
+
+    def wrapped_fitness_function(chromosome):
+        if isinstance(chromosome, np.ndarray):
+            chromosome = chromosome.tolist()
+        return lookup(tuple(chromosome))
+
+    wrapped_fitness_function.cache_info = lookup.cache_info
+    wrapped_fitness_function.cache_clear = lookup.cache_clear
+    return wrapped_fitness_function
+
+
+@njit(cache=True, parallel=True)
+def _evaluate_population_kernel(chromosomes, fitness_function, fitnesses):
+    # Compiled population evaluation; the rows of the chromosome matrix are spread over threads
+    for i in prange(chromosomes.shape[0]):
+        fitnesses[i] = fitness_function(chromosomes[i])
+
 
+def evaluate_population(population, fitness_function, workers=None):
+    """
+    Evaluates the fitness of every candidate in a population.
+
+    Each candidate is evaluated independently, so the work can be spread over several processes. This only pays off
+    when the fitness function is expensive; leave workers as None for cheap fitness functions.
+
+    :param population: List of Candidate objects, or a (pop_size, gene_size) chromosome matrix as returned by
+        get_random_population.
+    :param fitness_function: A function that takes a chromosome and returns a fitness value. If it is compiled with
+        Numba (see sum_fitness) and the population is a matrix, the rows are evaluated in parallel threads instead.
+    :param workers: The number of worker processes to use, or None to evaluate in the current process. The fitness
+        function must then be picklable, i.e. defined at module level.
+    :return: A NumPy vector holding the fitness of each candidate. Candidate objects also get their fitness updated.
+    """
+    fitnesses = np.empty(len(population))
+    if isinstance(population, np.ndarray) and is_jitted(fitness_function):
+        _evaluate_population_kernel(population, fitness_function, fitnesses)
+    else:
+        if isinstance(population, np.ndarray):
+            chromosomes = population.tolist()  # Python fitness functions take lists (see Candidate.calculate_fitness)
+        else:
+            chromosomes = [_fitness_argument(candidate.chromosome, fitness_function) for candidate in population]
+
+        if workers is None:
+            fitnesses[:] = [fitness_function(chromosome) for chromosome in chromosomes]
+        else:
+            # Hand out several candidates per task to keep inter-process overhead low
+            chunk_size = max(1, len(chromosomes) // (4 * workers))
+            # Spawn fresh workers: forking after Numba has started its thread pool can deadlock the children
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                fitnesses[:] = list(executor.map(fitness_function, chromosomes, chunksize=chunk_size))
+
+    if not isinstance(population, np.ndarray):
+        for candidate, fitness in zip(population, fitnesses):
+            candidate.fitness = fitness
+
+    return fitnesses
+
+
+@njit(cache=True)
+def sum_fitness(chromosome):
+    """
+    Example fitness function: sum of chromosome values.
+
+    Compiled with Numba so that it can be called from inside the compiled search kernels. Without Numba it is called
+    with a list of genes, like any other Python fitness function.
+    """
+    # Accumulate in a wide integer, as a sum of narrow genes would overflow
+    total = 0
+    for gene in chromosome:
+        total += gene
+    return total
+
+
+@njit(cache=True)
+def sum_delta(fitness, old_gene, new_gene, index, chromosome):
+    """
+    Incremental counterpart of sum_fitness: the fitness after one gene changes, computed in O(1).
+
+    :param fitness: The fitness of the chromosome before the change.
+    :param old_gene: The current value of the gene being changed.
+    :param new_gene: The value the gene is changed to.
+    :param index: The index of the gene being changed.
+    :param chromosome: The chromosome before the change.
+    :return: The fitness of the chromosome after the change.
+    """
+    return fitness - old_gene + new_gene
+
+
+@njit(cache=True)
+def _hill_climb_kernel(chromosome, fitness, fitness_function, delta_fitness, max_iterations, gene_high):
+    # Compiled Hill Climbing loop starting from a chromosome of the given fitness; mutates the chromosome in place and
+    # returns its final fitness
+    for _ in range(max_iterations):
+        # Pick one random gene and a new value for it
+        index_to_modify = np.random.randint(0, chromosome.size)
+        old_gene = chromosome[index_to_modify]
+        new_gene = np.random.randint(0, gene_high + 1)
+
+        # Evaluate the change incrementally if possible, otherwise apply it, evaluate and roll it back
+        if delta_fitness is None:
+            chromosome[index_to_modify] = new_gene
+            neighbor_fitness = fitness_function(chromosome)
+            chromosome[index_to_modify] = old_gene
+        else:
+            neighbor_fitness = delta_fitness(fitness, old_gene, new_gene, index_to_modify, chromosome)
 
-def hill_climb(candidate, fitness_function, max_iterations=1000):
+        # Keep the change only if it improves the fitness
+        if neighbor_fitness > fitness:
+            chromosome[index_to_modify] = new_gene
+            fitness = neighbor_fitness
+
+    return fitness
+
+
+def hill_climb(candidate, fitness_function, max_iterations=1000, delta_fitness=None, cache_capacity=None):
     """
     Performs Hill Climbing on the given Candidate object.
 
     :param candidate: The initial Candidate object.
     :param fitness_function: A function that evaluates and returns the fitness of a chromosome.
     :param max_iterations: The maximum number of iterations to perform.
+    :param delta_fitness: Optional function (fitness, old_gene, new_gene, index, chromosome) returning the fitness
+        after a single gene change without re-evaluating the whole chromosome (see sum_delta).
+    :param cache_capacity: If given, fitness values are memoized in an LRU cache of this size (see cached_fitness), and
+        its hit statistics are logged at DEBUG level. This disables the compiled Numba path.
     :return: The best Candidate found.
 
     Explanation:
@@ -59,46 +268,115 @@ def hill_climb(candidate, fitness_function, max_iterations=1000):
             The function performs a specified number of iterations (max_iterations) or until no better solutions can be found.
         Return:
             After reaching the maximum iterations, it returns the best candidate found.
+        Compiled Fast Path:
+            If the fitness function is compiled with Numba (see sum_fitness), the whole loop runs in compiled code.
     """
+    if cache_capacity is not None:
+        fitness_function = cached_fitness(fitness_function, cache_capacity)
+
     # Evaluate the initial candidate's fitness
     candidate.calculate_fitness(fitness_function)
 
+    if is_jitted(fitness_function) and (delta_fitness is None or is_jitted(delta_fitness)):
+        chromosome = candidate.chromosome.copy()
+        fitness = _hill_climb_kernel(chromosome, candidate.fitness, fitness_function, delta_fitness, max_iterations,
+                                     100)
+        return Candidate(chromosome, fitness)
+
+    # Work on a single copy of the chromosome, changing one gene at a time in place. It is kept as a list: Python
+    # fitness functions are called with lists (see Candidate.calculate_fitness), and compiled delta functions are called
+    # through their pure Python version, which is much cheaper to call with plain numbers than the compiled one.
+    chromosome = candidate.chromosome.tolist()
+    fitness = candidate.fitness
+    if is_jitted(delta_fitness):
+        delta_fitness = delta_fitness.py_func
+
     for iteration in range(max_iterations):
-        # Create a neighbor by modifying one element in the chromosome
-        neighbor_chromosome = candidate.chromosome[:]
-        index_to_modify = random.randint(0, len(neighbor_chromosome) - 1)
+        # Draw the random gene positions and values in vectorized chunks, refilling when a chunk is used up
+        chunk_index = iteration % RANDOM_CHUNK_SIZE
+        if chunk_index == 0:
+            indices_to_modify = rng.integers(0, len(chromosome), size=RANDOM_CHUNK_SIZE).tolist()
+            new_genes = rng.integers(0, 101, size=RANDOM_CHUNK_SIZE).tolist()
 
-        # Change the selected gene (in this case by a small random value for the sake of simplicity)
-        neighbor_chromosome[index_to_modify] = random.randint(0, 100)
+        # Create a neighbor by modifying one element in the chromosome, remembering its old value
+        index_to_modify = indices_to_modify[chunk_index]
+        old_gene = chromosome[index_to_modify]
 
-        # Create a new candidate from the modified chromosome
-        neighbor = Candidate(neighbor_chromosome)
-        neighbor.calculate_fitness(fitness_function)
+        # Change the selected gene (in this case by a small random value for the sake of simplicity)
+        new_gene = new_genes[chunk_index]
+        if delta_fitness is not None:
+            neighbor_fitness = delta_fitness(fitness, old_gene, new_gene, index_to_modify, chromosome)
+        else:
+            chromosome[index_to_modify] = new_gene
+            neighbor_fitness = fitness_function(chromosome)
+            chromosome[index_to_modify] = old_gene
 
         # If the neighbor has better fitness, move to the neighbor
-        if neighbor.fitness > candidate.fitness:
-            candidate = neighbor
+        if neighbor_fitness > fitness:
+            chromosome[index_to_modify] = new_gene
+            fitness = neighbor_fitness
 
-    return candidate
+    if cache_capacity is not None:
+        logger.debug("hill_climb fitness cache: %s", fitness_function.cache_info())
+
+    return Candidate(np.array(chromosome, dtype=candidate.chromosome.dtype), fitness)
 
 
 def test_HC():
-    def example_fitness_function(chromosome):
-        return sum(chromosome)
+    # Example fitness function: sum of chromosome values, compiled so the search runs in the Numba kernel
+    example_fitness_function = sum_fitness
 
     # Initial candidate with a random chromosome
-    initial_candidate = Candidate([random.randint(0, 100) for _ in range(50)])
+    initial_candidate = Candidate(rng.integers(0, 101, size=50, dtype=GENE_DTYPE))
 
     # Perform Hill Climbing on the initial candidate
-    best_candidate = hill_climb(initial_candidate, example_fitness_function)
+    best_candidate = hill_climb(initial_candidate, example_fitness_function, delta_fitness=sum_delta)
 
     # Output the best candidate's chromosome and fitness
     print(f"Best Chromosome: {best_candidate.chromosome}")
     print(f"Best Fitness: {best_candidate.fitness}")
 
 
+@njit(cache=True)
+def _simulated_annealing_kernel(chromosome, fitness, fitness_function, delta_fitness, initial_temperature,
+                                cooling_rate, min_temperature, gene_high):
+    # Compiled Simulated Annealing loop starting from a chromosome of the given fitness; mutates the chromosome in
+    # place and returns the best chromosome and fitness
+    best_chromosome = chromosome.copy()
+    best_fitness = fitness
+    current_temperature = initial_temperature
+
+    while current_temperature > min_temperature:
+        # Pick one random gene and a new value for it
+        index_to_modify = np.random.randint(0, chromosome.size)
+        old_gene = chromosome[index_to_modify]
+        new_gene = np.random.randint(0, gene_high + 1)
+
+        # Evaluate the change incrementally if possible, otherwise apply it, evaluate and roll it back
+        if delta_fitness is None:
+            chromosome[index_to_modify] = new_gene
+            neighbor_fitness = fitness_function(chromosome)
+            chromosome[index_to_modify] = old_gene
+        else:
+            neighbor_fitness = delta_fitness(fitness, old_gene, new_gene, index_to_modify, chromosome)
+
+        # Metropolis criterion: always accept improvements, accept worse moves with a temperature-dependent probability
+        fitness_diff = neighbor_fitness - fitness
+        if fitness_diff > 0 or np.random.random() < np.exp(fitness_diff / current_temperature):
+            chromosome[index_to_modify] = new_gene
+            fitness = neighbor_fitness
+            if fitness > best_fitness:
+                best_chromosome[:] = chromosome
+                best_fitness = fitness
+
+        # Cool the system
+        current_temperature *= (1 - cooling_rate)
+
+    return best_chromosome, best_fitness
+
+
 def simulated_annealing(candidate, fitness_function, initial_temperature=1000, cooling_rate=0.003,
-                        min_temperature=1e-5):
+                        min_temperature=1e-5, delta_fitness=None, cache_capacity=None):
     """
     Performs Simulated Annealing on a given Candidate object.
 
@@ -107,6 +385,10 @@ def simulated_annealing(candidate, fitness_function, initial_temperature=1000, c
     :param initial_temperature: Starting temperature for the annealing process.
     :param cooling_rate: Rate at which the temperature cools (typically a small positive value).
     :param min_temperature: The stopping temperature threshold for the process.
+    :param delta_fitness: Optional function (fitness, old_gene, new_gene, index, chromosome) returning the fitness
+        after a single gene change without re-evaluating the whole chromosome (see sum_delta).
+    :param cache_capacity: If given, fitness values are memoized in an LRU cache of this size (see cached_fitness), and
+        its hit statistics are logged at DEBUG level. This disables the compiled Numba path.
     :return: The best Candidate found.
 
     Explanation:
@@ -122,60 +404,132 @@ def simulated_annealing(candidate, fitness_function, initial_temperature=1000, c
             After each iteration, the temperature is reduced by multiplying it by (1 - cooling_rate), slowly "cooling" the system.
         Termination:
             The process stops when the temperature falls below min_temperature, returning the best solution found.
+        Compiled Fast Path:
+            If the fitness function is compiled with Numba (see sum_fitness), the whole loop runs in compiled code.
     """
+    if cache_capacity is not None:
+        fitness_function = cached_fitness(fitness_function, cache_capacity)
+
     # Calculate the initial candidate's fitness
     candidate.calculate_fitness(fitness_function)
+
+    if is_jitted(fitness_function) and (delta_fitness is None or is_jitted(delta_fitness)):
+        best_chromosome, best_fitness = _simulated_annealing_kernel(
+            candidate.chromosome.copy(), candidate.fitness, fitness_function, delta_fitness, initial_temperature,
+            cooling_rate, min_temperature, 100)
+        return Candidate(best_chromosome, best_fitness)
+
     current_temperature = initial_temperature
 
+    # Work on a single list copy of the chromosome, changing one gene at a time in place (see hill_climb)
+    chromosome = candidate.chromosome.tolist()
+    fitness = candidate.fitness
+    if is_jitted(delta_fitness):
+        delta_fitness = delta_fitness.py_func
+
     # Keep track of the best solution found
-    best_candidate = candidate
+    best_chromosome = chromosome.copy()
+    best_fitness = fitness
 
+    # Bind math.exp to a local name for the loop
+    exp = math.exp
+
+    iteration = 0
     while current_temperature > min_temperature:
-        # Create a neighbor by modifying one element in the chromosome
-        neighbor_chromosome = candidate.chromosome[:]
-        index_to_modify = random.randint(0, len(neighbor_chromosome) - 1)
+        # Draw the random numbers in vectorized chunks, refilling when a chunk is used up
+        chunk_index = iteration % RANDOM_CHUNK_SIZE
+        if chunk_index == 0:
+            indices_to_modify = rng.integers(0, len(chromosome), size=RANDOM_CHUNK_SIZE).tolist()
+            new_genes = rng.integers(0, 101, size=RANDOM_CHUNK_SIZE).tolist()
+            acceptance_draws = rng.random(RANDOM_CHUNK_SIZE).tolist()
 
-        # Change the selected gene by a small random value
-        neighbor_chromosome[index_to_modify] = random.randint(0, 100)
+        # Create a neighbor by modifying one element in the chromosome, remembering its old value
+        index_to_modify = indices_to_modify[chunk_index]
+        old_gene = chromosome[index_to_modify]
 
-        # Create a new Candidate from the modified chromosome
-        neighbor = Candidate(neighbor_chromosome)
-        neighbor.calculate_fitness(fitness_function)
+        # Change the selected gene by a small random value
+        new_gene = new_genes[chunk_index]
+        if delta_fitness is not None:
+            neighbor_fitness = delta_fitness(fitness, old_gene, new_gene, index_to_modify, chromosome)
+        else:
+            chromosome[index_to_modify] = new_gene
+            neighbor_fitness = fitness_function(chromosome)
+            chromosome[index_to_modify] = old_gene
 
         # Calculate the difference in fitness
-        fitness_diff = neighbor.fitness - candidate.fitness
+        fitness_diff = neighbor_fitness - fitness
 
         # Decide whether to move to the new candidate
-        if fitness_diff > 0 or random.random() < math.exp(fitness_diff / current_temperature):
-            candidate = neighbor
+        if fitness_diff > 0 or acceptance_draws[chunk_index] < exp(fitness_diff / current_temperature):
+            chromosome[index_to_modify] = new_gene
+            fitness = neighbor_fitness
 
             # Update the best candidate found if this one is better
-            if neighbor.fitness > best_candidate.fitness:
-                best_candidate = neighbor
+            if fitness > best_fitness:
+                best_chromosome = chromosome.copy()
+                best_fitness = fitness
 
         # Cool the system
         current_temperature *= (1 - cooling_rate)
+        iteration += 1
 
-    return best_candidate
+    if cache_capacity is not None:
+        logger.debug("simulated_annealing fitness cache: %s", fitness_function.cache_info())
+
+    return Candidate(np.array(best_chromosome, dtype=candidate.chromosome.dtype), best_fitness)
 
 
 def test_SA():
-    # Example fitness function: sum of chromosome values
-    def example_fitness_function(chromosome):
-        return sum(chromosome)
+    # Example fitness function: sum of chromosome values, compiled so the search runs in the Numba kernel
+    example_fitness_function = sum_fitness
 
     # Initial candidate with a random chromosome
-    initial_candidate = Candidate([random.randint(0, 100) for _ in range(50)])
+    initial_candidate = Candidate(rng.integers(0, 101, size=50, dtype=GENE_DTYPE))
 
     # Perform Simulated Annealing on the initial candidate
-    best_candidate = simulated_annealing(initial_candidate, example_fitness_function)
+    best_candidate = simulated_annealing(initial_candidate, example_fitness_function, delta_fitness=sum_delta)
 
     # Output the best candidate's chromosome and fitness
     print(f"Best Chromosome: {best_candidate.chromosome}")
     print(f"Best Fitness: {best_candidate.fitness}")
 
 
-def tabu_search(initial_candidate, fitness_function, tabu_list_size=10, max_iterations=100, neighborhood_size=10):
+class TabuSet:
+    def __init__(self, maxlen):
+        """
+        Initialize a TabuSet: a bounded first-in-first-out memory of chromosomes with O(1) membership tests.
+
+        :param maxlen: The maximum number of chromosomes remembered.
+        """
+        self.maxlen = maxlen
+        self.queue = deque()  # Chromosome fingerprints in insertion order, used for eviction
+        self.counts = {}  # Fingerprint -> number of occurrences in the queue, used for membership tests
+
+    def append(self, chromosome):
+        """
+        Remembers a chromosome, forgetting the oldest one if the memory is full.
+
+        :param chromosome: The chromosome to add.
+        """
+        key = chromosome.tobytes()
+        self.queue.append(key)
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+        while len(self.queue) > self.maxlen:
+            evicted = self.queue.popleft()
+            self.counts[evicted] -= 1
+            if self.counts[evicted] == 0:
+                del self.counts[evicted]
+
+    def __contains__(self, chromosome):
+        return chromosome.tobytes() in self.counts
+
+    def __len__(self):
+        return len(self.queue)
+
+
+def tabu_search(initial_candidate, fitness_function, tabu_list_size=10, max_iterations=100, neighborhood_size=10,
+                delta_fitness=None, cache_capacity=None):
     """
     Performs Tabu Search on a given Candidate object.
 
@@ -184,16 +538,21 @@ def tabu_search(initial_candidate, fitness_function, tabu_list_size=10, max_iter
     :param tabu_list_size: The maximum size of the Tabu List.
     :param max_iterations: The maximum number of iterations to perform.
     :param neighborhood_size: The number of neighbors to explore in each iteration.
+    :param delta_fitness: Optional function (fitness, old_gene, new_gene, index, chromosome) returning the fitness
+        after a single gene change without re-evaluating the whole chromosome (see sum_delta).
+    :param cache_capacity: If given, fitness values are memoized in an LRU cache of this size (see cached_fitness), and
+        its hit statistics are logged at DEBUG level. This disables the compiled Numba path.
     :return: The best Candidate found.
 
     Explanation:
         Initial Setup:
             The fitness of the initial candidate is calculated using the provided fitness_function.
             The initial candidate is set as both the current_candidate and best_candidate.
-            A Tabu List is initialized using deque with a maximum size (tabu_list_size), ensuring that old solutions are removed as new ones are added.
+            A Tabu List is initialized using a TabuSet with a maximum size (tabu_list_size), ensuring that old solutions are removed as new ones are added.
         Neighborhood Generation:
             In each iteration, a neighborhood of candidates is generated by randomly modifying one gene in the chromosome.
-            Each neighbor's fitness is calculated, and they are added to the neighborhood list.
+            The whole neighborhood is built at once as a matrix with one neighbor per row.
+            Each neighbor's fitness is calculated, and they are collected in a fitness vector. The matrix is evaluated with evaluate_population, so a Numba-compiled fitness function evaluates all neighbors in one parallel call.
         Tabu List and Aspiration Criteria:
             The best candidate from the neighborhood that is not in the Tabu List (or meets the aspiration criteria by having a fitness better than the best overall solution) is selected as the best_neighbor.
             This allows Tabu Search to avoid revisiting recently explored solutions while considering moving to better ones.
@@ -204,51 +563,69 @@ def tabu_search(initial_candidate, fitness_function, tabu_list_size=10, max_iter
         Termination:
             The search stops after a given number of iterations (max_iterations), and the best candidate found is returned.
     """
+    if cache_capacity is not None:
+        fitness_function = cached_fitness(fitness_function, cache_capacity)
+
     # Calculate the fitness of the initial candidate
     initial_candidate.calculate_fitness(fitness_function)
 
-    # Initialize the current candidate and best candidate as the initial candidate
-    current_candidate = initial_candidate
-    best_candidate = initial_candidate
+    # The current candidate is a single working copy of the chromosome which moves are applied to in place
+    current_chromosome = initial_candidate.chromosome.copy()
+    current_fitness = initial_candidate.fitness
+    best_candidate = Candidate(current_chromosome.copy(), current_fitness)
 
     # Initialize an empty Tabu List
-    tabu_list = deque(maxlen=tabu_list_size)
+    tabu_list = TabuSet(tabu_list_size)
 
     # Add the initial candidate's chromosome to the Tabu List
-    tabu_list.append(tuple(current_candidate.chromosome))
+    tabu_list.append(current_chromosome)
 
-    # Iterate through the search process
-    for iteration in range(max_iterations):
-        # Generate a neighborhood of candidates
-        neighborhood = []
-        for _ in range(neighborhood_size):
-            # Create a neighbor by modifying one random gene in the chromosome
-            neighbor_chromosome = current_candidate.chromosome[:]
-            index_to_modify = random.randint(0, len(neighbor_chromosome) - 1)
-            neighbor_chromosome[index_to_modify] = random.randint(0, 100)
+    gene_size = len(current_chromosome)
+    if is_jitted(delta_fitness):
+        delta_fitness = delta_fitness.py_func  # Called with plain numbers below (see hill_climb)
+    neighbor_rows = np.arange(neighborhood_size)
 
-            # Create a new candidate from the modified chromosome
-            neighbor = Candidate(neighbor_chromosome)
-            neighbor.calculate_fitness(fitness_function)
+    # Draw the random moves of every iteration up front, one row per iteration
+    all_indices_to_modify = rng.integers(0, gene_size, size=(max_iterations, neighborhood_size))
+    all_new_genes = rng.integers(0, 101, size=(max_iterations, neighborhood_size)).astype(current_chromosome.dtype)
 
-            # Add the neighbor to the neighborhood
-            neighborhood.append(neighbor)
+    # Iterate through the search process
+    for indices_to_modify, new_genes in zip(all_indices_to_modify, all_new_genes):
+        # Generate the whole neighborhood at once: each row is the current chromosome with one random gene modified
+        neighborhood = current_chromosome[np.newaxis].repeat(neighborhood_size, axis=0)
+        neighborhood[neighbor_rows, indices_to_modify] = new_genes
+
+        # Evaluate the neighborhood, incrementally move by move if possible
+        if delta_fitness is not None:
+            current_genes = current_chromosome.tolist()
+            neighbor_fitnesses = np.array([
+                delta_fitness(current_fitness, current_genes[index_to_modify], new_gene, index_to_modify,
+                              current_genes)
+                for index_to_modify, new_gene in zip(indices_to_modify.tolist(), new_genes.tolist())
+            ])
+        else:
+            neighbor_fitnesses = evaluate_population(neighborhood, fitness_function)
 
         # Find the best neighbor that is not in the Tabu List or meets aspiration criteria
-        best_neighbor = None
-        for neighbor in neighborhood:
-            if tuple(neighbor.chromosome) not in tabu_list or neighbor.fitness > best_candidate.fitness:
-                if best_neighbor is None or neighbor.fitness > best_neighbor.fitness:
-                    best_neighbor = neighbor
-
-        # If a better solution is found, update the current and best candidates
-        if best_neighbor and best_neighbor.fitness > current_candidate.fitness:
-            current_candidate = best_neighbor
-            if best_neighbor.fitness > best_candidate.fitness:
-                best_candidate = best_neighbor
+        allowed = np.fromiter((neighbor not in tabu_list for neighbor in neighborhood), dtype=bool,
+                              count=neighborhood_size)
+        allowed |= neighbor_fitnesses > best_candidate.fitness
+        allowed_rows = np.flatnonzero(allowed)
+
+        # If a better solution is found, apply its move to the current chromosome and update the best candidate
+        if allowed_rows.size > 0:
+            best_row = allowed_rows[np.argmax(neighbor_fitnesses[allowed_rows])]
+            if neighbor_fitnesses[best_row] > current_fitness:
+                current_chromosome[indices_to_modify[best_row]] = new_genes[best_row]
+                current_fitness = neighbor_fitnesses[best_row]
+                if current_fitness > best_candidate.fitness:
+                    best_candidate = Candidate(current_chromosome.copy(), current_fitness)
 
         # Add the current candidate's chromosome to the Tabu List
-        tabu_list.append(tuple(current_candidate.chromosome))
+        tabu_list.append(current_chromosome)
+
+    if cache_capacity is not None:
+        logger.debug("tabu_search fitness cache: %s", fitness_function.cache_info())
 
     return best_candidate
 
@@ -259,7 +636,7 @@ def test_TS():
         return sum(chromosome)
 
     # Initial candidate with a random chromosome
-    initial_candidate = Candidate([random.randint(0, 100) for _ in range(50)])
+    initial_candidate = Candidate(rng.integers(0, 101, size=50, dtype=GENE_DTYPE))
 
     # Perform Tabu Search on the initial candidate
     best_candidate = tabu_search(initial_candidate, example_fitness_function)
@@ -269,60 +646,61 @@ def test_TS():
     print(f"Best Fitness: {best_candidate.fitness}")
 
 
-def roulette_wheel_selection(generation):
+def _fitness_array(generation):
+    # Collect the fitness values of a list of Candidate objects into a NumPy vector
+    return np.fromiter((candidate.fitness for candidate in generation), dtype=np.float64, count=len(generation))
+
+
+def roulette_wheel_selection(generation, fitnesses=None):
     """
     Perform Roulette Wheel Selection.
 
     :param generation: List of Candidate objects.
+    :param fitnesses: Optional NumPy vector of the candidates' fitness values, e.g. as returned by evaluate_population.
+        Passing it saves collecting them from the candidates on every call.
     :return: A tuple of two selected parents.
     """
-    # Calculate the total fitness of the generation
-    total_fitness = sum(candidate.fitness for candidate in generation)
-
-    # Create a helper function to perform roulette wheel selection once
-    def select_one():
-        pick = random.uniform(0, total_fitness)
-        current = 0
-        for candidate in generation:
-            current += candidate.fitness
-            if current > pick:
-                return candidate
-
-    # Select two parents
-    parent1 = select_one()
-    parent2 = select_one()
-    while parent2 == parent1:
-        parent2 = select_one()
+    if fitnesses is None:
+        fitnesses = _fitness_array(generation)
 
-    return parent1, parent2
+    # Calculate the cumulative fitness of the generation, the last entry being the total fitness
+    cumulative_fitness = np.cumsum(fitnesses)
+    total_fitness = cumulative_fitness[-1]
+
+    # Select two parents at once: each pick lands on the first candidate whose cumulative fitness exceeds it
+    picks = rng.uniform(0, total_fitness, size=2)
+    index1, index2 = np.searchsorted(cumulative_fitness, picks, side='right')
+    while index2 == index1:
+        index2 = np.searchsorted(cumulative_fitness, rng.uniform(0, total_fitness), side='right')
 
+    return generation[index1], generation[index2]
 
-def rank_based_selection(generation):
+
+def rank_based_selection(generation, fitnesses=None):
     """
     Perform Rank-Based Selection.
 
     :param generation: List of Candidate objects.
+    :param fitnesses: Optional NumPy vector of the candidates' fitness values, e.g. as returned by evaluate_population.
+        Passing it saves collecting them from the candidates on every call.
     :return: A tuple of two selected parents.
     """
-    # Rank the generation by fitness
-    ranked_generation = sorted(generation, key=lambda c: c.fitness)
+    if fitnesses is None:
+        fitnesses = _fitness_array(generation)
 
-    # Assign selection probabilities based on rank
-    total_ranks = sum(range(1, len(ranked_generation) + 1))
+    # Rank the generation by fitness (indices of the candidates from worst to best)
+    ranked_indices = np.argsort(fitnesses, kind='stable')
 
-    def select_one():
-        pick = random.uniform(0, total_ranks)
-        current = 0
-        for i, candidate in enumerate(ranked_generation):
-            current += (i + 1)  # rank is 1-based
-            if current > pick:
-                return candidate
+    # Assign selection probabilities based on rank (rank is 1-based), the ranks summing to n(n+1)/2
+    n = len(generation)
+    total_ranks = n * (n + 1) // 2
+    cumulative_ranks = np.cumsum(np.arange(1, n + 1))
 
-    # Select two parents
-    parent1 = select_one()
-    parent2 = select_one()
+    # Select two parents at once: each pick lands on the first rank whose cumulative total exceeds it
+    picks = rng.uniform(0, total_ranks, size=2)
+    index1, index2 = ranked_indices[np.searchsorted(cumulative_ranks, picks, side='right')]
 
-    return parent1, parent2
+    return generation[index1], generation[index2]
 
 
 def tournament_selection(generation, tournament_size=3):
@@ -333,59 +711,65 @@ def tournament_selection(generation, tournament_size=3):
     :param tournament_size: Size of the tournament.
     :return: A tuple of two selected parents.
     """
+    # Randomly select k candidates for each of the two tournaments at once. Only the contestants are looked at, so a
+    # selection costs O(k) however large the generation is.
+    contestants = random.choices(generation, k=2 * tournament_size)
 
-    def select_one():
-        # Randomly select k candidates for the tournament
-        tournament = random.sample(generation, tournament_size)
-        # Return the best candidate from the tournament
-        return max(tournament, key=lambda candidate: candidate.fitness)
-
-    # Select two parents
-    parent1 = select_one()
-    parent2 = select_one()
+    # The best candidate from each tournament becomes a parent
+    parent1 = max(contestants[:tournament_size], key=lambda candidate: candidate.fitness)
+    parent2 = max(contestants[tournament_size:], key=lambda candidate: candidate.fitness)
 
     return parent1, parent2
 
 
-def stochastic_universal_sampling(generation, num_parents=2):
+def stochastic_universal_sampling(generation, num_parents=2, fitnesses=None):
     """
     Perform Stochastic Universal Sampling.
 
     :param generation: List of Candidate objects.
     :param num_parents: Number of parents to select.
+    :param fitnesses: Optional NumPy vector of the candidates' fitness values, e.g. as returned by evaluate_population.
+        Passing it saves collecting them from the candidates on every call.
     :return: A tuple of two selected parents.
     """
-    total_fitness = sum(candidate.fitness for candidate in generation)
-    pointer_spacing = total_fitness / num_parents
-    start_point = random.uniform(0, pointer_spacing)
+    if fitnesses is None:
+        fitnesses = _fitness_array(generation)
 
-    parents = []
-    current_point = start_point
-    cumulative_fitness = 0
+    cumulative_fitness = np.cumsum(fitnesses)
+    total_fitness = cumulative_fitness[-1]
+    pointer_spacing = total_fitness / num_parents
+    start_point = rng.uniform(0, pointer_spacing)
 
-    for candidate in generation:
-        cumulative_fitness += candidate.fitness
-        while cumulative_fitness > current_point and len(parents) < num_parents:
-            parents.append(candidate)
-            current_point += pointer_spacing
+    # Each evenly spaced pointer selects the first candidate whose cumulative fitness exceeds it
+    pointers = start_point + pointer_spacing * np.arange(num_parents)
+    parents = [generation[index] for index in np.searchsorted(cumulative_fitness, pointers, side='right').tolist()]
 
     return parents[0], parents[1] #random.sample(parents, 2)
 
 
-def truncation_selection(generation, truncation_percentage=0.5):
+def _top_candidates(generation, count, fitnesses=None):
+    # Return the count fittest candidates (in no particular order) using an O(n) partial selection
+    if count <= 0:
+        return []
+    if fitnesses is None:
+        fitnesses = _fitness_array(generation)
+    top_indices = np.argpartition(-fitnesses, count - 1)[:count]
+    return [generation[index] for index in top_indices]
+
+
+def truncation_selection(generation, truncation_percentage=0.5, fitnesses=None):
     """
     Perform Truncation Selection.
 
     :param generation: List of Candidate objects.
     :param truncation_percentage: Fraction of top candidates to select from.
+    :param fitnesses: Optional NumPy vector of the candidates' fitness values, e.g. as returned by evaluate_population.
+        Passing it saves collecting them from the candidates on every call.
     :return: A tuple of two selected parents.
     """
-    # Sort the generation by fitness
-    sorted_generation = sorted(generation, key=lambda c: c.fitness, reverse=True)
-
-    # Select the top percentage
+    # Select the top percentage, partitioning by fitness instead of fully sorting the generation
     truncation_size = int(truncation_percentage * len(generation))
-    truncated_generation = sorted_generation[:truncation_size]
+    truncated_generation = _top_candidates(generation, truncation_size, fitnesses)
 
     # Randomly select two parents from the truncated group
     parent1 = random.choice(truncated_generation)
@@ -396,20 +780,19 @@ def truncation_selection(generation, truncation_percentage=0.5):
     return parent1, parent2
 
 
-def elitism_selection(generation, elite_fraction=0.1):
+def elitism_selection(generation, elite_fraction=0.1, fitnesses=None):
     """
     Perform Elitism Selection, carrying over the best individuals to the next generation.
 
     :param generation: List of Candidate objects.
     :param elite_fraction: Fraction of top candidates to retain.
+    :param fitnesses: Optional NumPy vector of the candidates' fitness values, e.g. as returned by evaluate_population.
+        Passing it saves collecting them from the candidates on every call.
     :return: A tuple of two selected elite parents.
     """
-    # Sort the generation by fitness
-    sorted_generation = sorted(generation, key=lambda c: c.fitness, reverse=True)
-
-    # Select the top elite_fraction of candidates
+    # Select the top elite_fraction of candidates, partitioning by fitness instead of fully sorting the generation
     elite_size = max(1, int(elite_fraction * len(generation)))
-    elite_candidates = sorted_generation[:elite_size]
+    elite_candidates = _top_candidates(generation, elite_size, fitnesses)
 
     # Randomly select two parents from the elite candidates
     parent1 = random.choice(elite_candidates)
@@ -430,18 +813,11 @@ def n_point_crossover(parent1, parent2, n_points=2):
     length = len(parent1.chromosome)
     crossover_points = sorted(random.sample(range(1, length), n_points))
 
-    offspring_chromosome = []
-    swap = False
-
-    # Perform the crossover between points
-    prev_point = 0
-    for point in crossover_points + [length]:
-        if swap:
-            offspring_chromosome += parent2.chromosome[prev_point:point]
-        else:
-            offspring_chromosome += parent1.chromosome[prev_point:point]
-        swap = not swap
-        prev_point = point
+    # Start from a copy of Parent 1 and overwrite every second segment (those starting at odd points) from Parent 2
+    offspring_chromosome = parent1.chromosome.copy()
+    segment_bounds = crossover_points + [length]
+    for start, end in zip(segment_bounds[::2], segment_bounds[1::2]):
+        offspring_chromosome[start:end] = parent2.chromosome[start:end]
 
     return Candidate(offspring_chromosome)
 
@@ -454,9 +830,9 @@ def uniform_crossover(parent1, parent2):
     :param parent2: Second parent (Candidate object).
     :return: A new Candidate (offspring).
     """
-    offspring_chromosome = [
-        random.choice([gene1, gene2]) for gene1, gene2 in zip(parent1.chromosome, parent2.chromosome)
-    ]
+    # Take each gene from either parent with equal probability
+    mask = rng.random(parent1.chromosome.size) < 0.5
+    offspring_chromosome = np.where(mask, parent1.chromosome, parent2.chromosome)
     return Candidate(offspring_chromosome)
 
 
@@ -469,9 +845,11 @@ def arithmetic_crossover(parent1, parent2, alpha=0.5):
     :param alpha: Weighting factor for averaging parent genes.
     :return: A new Candidate (offspring).
     """
-    offspring_chromosome = [
-        alpha * gene1 + (1 - alpha) * gene2 for gene1, gene2 in zip(parent1.chromosome, parent2.chromosome)
-    ]
+    # Blend in floating point, as the weighted genes are no longer integers
+    dtype = np.result_type(_float_dtype(parent1.chromosome), _float_dtype(parent2.chromosome))
+    genes1 = parent1.chromosome.astype(dtype)
+    genes2 = parent2.chromosome.astype(dtype)
+    offspring_chromosome = alpha * genes1 + (1 - alpha) * genes2
     return Candidate(offspring_chromosome)
 
 
@@ -484,12 +862,18 @@ def blend_crossover(parent1, parent2, alpha=0.5):
     :param alpha: Alpha parameter controlling the range of exploration.
     :return: A new Candidate (offspring).
     """
-    offspring_chromosome = []
-    for gene1, gene2 in zip(parent1.chromosome, parent2.chromosome):
-        d = abs(gene1 - gene2)
-        lower_bound = min(gene1, gene2) - alpha * d
-        upper_bound = max(gene1, gene2) + alpha * d
-        offspring_chromosome.append(random.uniform(lower_bound, upper_bound))
+    # Work in floating point, as the offspring genes are no longer integers and the gene distance overflows int8
+    dtype = np.result_type(_float_dtype(parent1.chromosome), _float_dtype(parent2.chromosome))
+    genes1 = parent1.chromosome.astype(dtype)
+    genes2 = parent2.chromosome.astype(dtype)
+    low = np.minimum(genes1, genes2)
+    high = np.maximum(genes1, genes2)
+    d = high - low
+    lower_bound = low - alpha * d
+    upper_bound = high + alpha * d
+
+    # Sample each gene uniformly between its bounds
+    offspring_chromosome = lower_bound + rng.random(d.size, dtype=dtype) * (upper_bound - lower_bound)
 
     return Candidate(offspring_chromosome)
 
@@ -505,7 +889,7 @@ def cut_and_splice_crossover(parent1, parent2):
     cut_point1 = random.randint(0, len(parent1.chromosome) - 1)
     cut_point2 = random.randint(0, len(parent2.chromosome) - 1)
 
-    offspring_chromosome = parent1.chromosome[:cut_point1] + parent2.chromosome[cut_point2:]
+    offspring_chromosome = np.concatenate((parent1.chromosome[:cut_point1], parent2.chromosome[cut_point2:]))
 
     return Candidate(offspring_chromosome)
 
@@ -522,17 +906,22 @@ def order_crossover(parent1, parent2):
 
     # Select a random segment from Parent 1
     start, end = sorted(random.sample(range(length), 2))
-    offspring_chromosome = [None] * length
+    offspring_chromosome = np.empty_like(parent1.chromosome)
     offspring_chromosome[start:end] = parent1.chromosome[start:end]
 
-    # Fill the remaining positions with Parent 2's genes in the same order
-    parent2_genes = [gene for gene in parent2.chromosome if gene not in offspring_chromosome]
+    # Collect Parent 2's genes in order, skipping the ones already placed from Parent 1.
+    # Placed genes are counted so that a repeated gene is only skipped as many times as it was placed.
+    placed = Counter(parent1.chromosome[start:end].tolist())
+    parent2_genes = []
+    for gene in parent2.chromosome.tolist():
+        if placed[gene] > 0:
+            placed[gene] -= 1
+        else:
+            parent2_genes.append(gene)
 
-    idx = 0
-    for i in range(length):
-        if offspring_chromosome[i] is None:
-            offspring_chromosome[i] = parent2_genes[idx]
-            idx += 1
+    # Fill the remaining positions with Parent 2's genes in the same order
+    offspring_chromosome[:start] = parent2_genes[:start]
+    offspring_chromosome[end:] = parent2_genes[start:start + length - end]
 
     return Candidate(offspring_chromosome)
 
@@ -545,15 +934,14 @@ def uniform_mutation(candidate, mutation_probability):
     :param mutation_probability: The probability that each gene will be mutated.
     :return: A new Candidate object after mutation.
     """
-    offspring_chromosome = []
+    length = candidate.chromosome.size
 
-    for gene in candidate.chromosome:
-        if random.random() < mutation_probability:
-            # Mutate the gene (assuming genes are integers, this could be customized)
-            new_gene = random.randint(0, 100)  # Adjust the range based on the problem
-        else:
-            new_gene = gene
-        offspring_chromosome.append(new_gene)
+    # Decide for every gene at once whether it mutates
+    mask = rng.random(length) < mutation_probability
+    # Mutated genes get a new random value (assuming genes are integers, adjust the range based on the problem)
+    new_genes = rng.integers(0, 101, size=length).astype(candidate.chromosome.dtype)
+
+    offspring_chromosome = np.where(mask, new_genes, candidate.chromosome)
 
     return Candidate(offspring_chromosome)
 
@@ -566,14 +954,13 @@ def multi_point_mutation(candidate, num_points=1):
     :param num_points: The number of genes to be mutated.
     :return: A new Candidate object after mutation.
     """
-    offspring_chromosome = candidate.chromosome[:]
+    offspring_chromosome = candidate.chromosome.copy()
 
     # Select num_points unique genes for mutation
-    mutation_indices = random.sample(range(len(offspring_chromosome)), num_points)
+    mutation_indices = rng.choice(offspring_chromosome.size, size=num_points, replace=False)
 
-    for index in mutation_indices:
-        # Mutate the selected gene (assuming genes are integers, this could be customized)
-        offspring_chromosome[index] = random.randint(0, 100)  # Adjust the range based on the problem
+    # Mutate the selected genes (assuming genes are integers, adjust the range based on the problem)
+    offspring_chromosome[mutation_indices] = rng.integers(0, 101, size=num_points)
 
     return Candidate(offspring_chromosome)
 
@@ -587,9 +974,10 @@ def gaussian_mutation(candidate, mean=0, stddev=1):
     :param stddev: Standard deviation of the Gaussian distribution.
     :return: A new Candidate after mutation.
     """
-    offspring_chromosome = [
-        gene + random.gauss(mean, stddev) for gene in candidate.chromosome
-    ]
+    # Add the noise in floating point, as the mutated genes are no longer integers
+    dtype = _float_dtype(candidate.chromosome)
+    noise = mean + stddev * rng.standard_normal(candidate.chromosome.size, dtype=dtype)
+    offspring_chromosome = candidate.chromosome.astype(dtype) + noise
     return Candidate(offspring_chromosome)
 
 
@@ -602,14 +990,17 @@ def boundary_mutation(candidate, lower_bound, upper_bound):
     :param upper_bound: Upper boundary for mutation.
     :return: A new Candidate after mutation.
     """
-    offspring_chromosome = candidate.chromosome[:]
-    mutation_index = random.randint(0, len(offspring_chromosome) - 1)
+    # Widen the genes if a boundary does not fit in the chromosome's dtype (e.g. 200 in an int8 chromosome)
+    bounds = np.array((lower_bound, upper_bound))
+    dtype = candidate.chromosome.dtype
+    if not np.array_equal(bounds.astype(dtype), bounds):
+        dtype = np.result_type(dtype, bounds.dtype)
+
+    offspring_chromosome = candidate.chromosome.astype(dtype)
+    mutation_index = rng.integers(offspring_chromosome.size)
 
     # Randomly set to lower or upper boundary
-    if random.random() < 0.5:
-        offspring_chromosome[mutation_index] = lower_bound
-    else:
-        offspring_chromosome[mutation_index] = upper_bound
+    offspring_chromosome[mutation_index] = bounds[rng.integers(2)]
 
     return Candidate(offspring_chromosome)
 
@@ -621,7 +1012,7 @@ def swap_mutation(candidate):
     :param candidate: Candidate object whose chromosome will be mutated.
     :return: A new Candidate after mutation.
     """
-    offspring_chromosome = candidate.chromosome[:]
+    offspring_chromosome = candidate.chromosome.copy()
     idx1, idx2 = random.sample(range(len(offspring_chromosome)), 2)
 
     # Swap the two genes
@@ -630,6 +1021,16 @@ def swap_mutation(candidate):
     return Candidate(offspring_chromosome)
 
 
+def _random_range(length):
+    # Draw two distinct positions in [0, length) and return them in order. Two scalar draws are several times cheaper
+    # than random.sample or rng.choice(replace=False), which build or permute the whole range.
+    start = random.randrange(length)
+    end = random.randrange(length - 1)
+    if end >= start:
+        end += 1
+    return (start, end) if start < end else (end, start)
+
+
 def scramble_mutation(candidate):
     """
     Perform Scramble Mutation by shuffling a random subset of the chromosome.
@@ -637,15 +1038,13 @@ def scramble_mutation(candidate):
     :param candidate: Candidate object whose chromosome will be mutated.
     :return: A new Candidate after mutation.
     """
-    offspring_chromosome = candidate.chromosome[:]
+    offspring_chromosome = candidate.chromosome.copy()
 
     # Select a random range to scramble
-    start, end = sorted(random.sample(range(len(offspring_chromosome)), 2))
-    scrambled_part = offspring_chromosome[start:end]
-
-    random.shuffle(scrambled_part)
+    start, end = _random_range(offspring_chromosome.size)
 
-    offspring_chromosome[start:end] = scrambled_part
+    # Shuffle the range in place through a view of the offspring's chromosome
+    rng.shuffle(offspring_chromosome[start:end])
 
     return Candidate(offspring_chromosome)
 
@@ -657,13 +1056,13 @@ def inversion_mutation(candidate):
     :param candidate: Candidate object whose chromosome will be mutated.
     :return: A new Candidate after mutation.
     """
-    offspring_chromosome = candidate.chromosome[:]
+    offspring_chromosome = candidate.chromosome.copy()
 
     # Select a random range to invert
-    start, end = sorted(random.sample(range(len(offspring_chromosome)), 2))
+    start, end = _random_range(offspring_chromosome.size)
 
-    # Invert the selected range
-    offspring_chromosome[start:end] = offspring_chromosome[start:end][::-1]
+    # Invert the selected range, reading it from the parent so that NumPy needs no temporary copy of the overlap
+    offspring_chromosome[start:end] = candidate.chromosome[start:end][::-1]
 
     return Candidate(offspring_chromosome)
 
@@ -689,7 +1088,7 @@ def non_uniform_mutation(candidate, generation, max_generations, mutation_probab
         else:
             offspring_chromosome.append(gene)
 
-    return Candidate(offspring_chromosome)
+    return Candidate(np.array(offspring_chromosome, dtype=_float_dtype(candidate.chromosome)))
 
 
 def adaptive_mutation(candidate, population, improvement_threshold=0.1, mutation_probability=0.1):
@@ -718,4 +1117,4 @@ def adaptive_mutation(candidate, population, improvement_threshold=0.1, mutation
             new_gene = gene
         offspring_chromosome.append(new_gene)
 
-    return Candidate(offspring_chromosome)
+    return Candidate(np.array(offspring_chromosome, dtype=candidate.chromosome.dtype))